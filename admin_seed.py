@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Shared admin-user seeding helper.
+
+The admin CLI scripts each used to open their own app context and run
+their own query/insert logic, paying SQLAlchemy engine bootstrap twice
+when invoked back-to-back in CI. They now share this function, which
+works on an already-initialized session so callers (and tests) can batch
+several seeding steps under one app context.
+"""
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects.sqlite import insert
+
+from src.models.admin import AdminUser
+
+
+def ensure_admin_user(session, replace=False, **fields):
+    """Idempotently seed an AdminUser from the given field values.
+
+    Returns (admin_user, created). With replace=False an existing row
+    with the same username is left untouched; with replace=True its
+    columns are overwritten in place. Either way the seed is a single
+    INSERT ... ON CONFLICT round trip rather than SELECT/DELETE/INSERT.
+    ``fields`` are passed straight to the AdminUser constructor and must
+    include ``username``.
+    """
+    # Build the instance so constructor-side behaviour (password
+    # hashing) still applies, then lift its column values for the upsert.
+    admin_user = AdminUser(**fields)
+    values = {
+        attr.key: getattr(admin_user, attr.key)
+        for attr in inspect(AdminUser).mapper.column_attrs
+        if getattr(admin_user, attr.key) is not None
+    }
+
+    stmt = insert(AdminUser).values(**values)
+    if replace:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['username'],
+            set_={key: value for key, value in values.items()
+                  if key != 'username'}
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=['username'])
+
+    result = session.execute(stmt)
+    session.commit()
+
+    if not result.rowcount:
+        # Row already existed and was kept. Select only the columns the
+        # reporting path reads instead of hydrating a full ORM instance;
+        # the returned Row supports the same attribute access.
+        existing = session.query(
+            AdminUser.username, AdminUser.email,
+            AdminUser.role, AdminUser.is_active
+        ).filter_by(username=fields['username']).first()
+        return existing, False
+
+    return admin_user, True
@@ -9,26 +9,24 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.models.user import User, db
 from src.main import app
+from sqlalchemy.dialects.sqlite import insert
 import bcrypt
 
+# Built once at import time so statement compilation is cached; the
+# ON CONFLICT clause makes the bootstrap a single idempotent round-trip
+# that is safe under concurrent CI fixture setup.
+ADMIN_INSERT = insert(User).on_conflict_do_nothing(index_elements=['username'])
+
 def create_admin_user():
     """Create an admin user for testing."""
     with app.app_context():
-        # Check if admin user already exists
-        admin_user = User.query.filter_by(username='admin').first()
-        if admin_user:
-            print("Admin user already exists!")
-            print(f"Username: {admin_user.username}")
-            print(f"Email: {admin_user.email}")
-            print(f"User Type: {admin_user.user_type}")
-            print(f"2FA Enabled: {admin_user.is_2fa_enabled}")
-            return
-
-        # Create admin user
+        # This is a throwaway test credential, so use a low bcrypt cost
+        # instead of the ~250ms default of rounds=12.
         password = "admin123456"  # Strong password for testing
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        
-        admin_user = User(
+        bcrypt_rounds = int(os.environ.get("OMNIAI_TEST_BCRYPT_ROUNDS", "4"))
+        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=bcrypt_rounds))
+
+        result = db.session.execute(ADMIN_INSERT.values(
             username='admin',
             email='admin@omniai.com',
             password_hash=password_hash.decode('utf-8'),
@@ -38,11 +36,13 @@ def create_admin_user():
             is_active=True,
             email_verified=True,
             is_2fa_enabled=False  # Will be enabled through the UI
-        )
-        
-        db.session.add(admin_user)
+        ))
         db.session.commit()
-        
+
+        if not result.rowcount:
+            print("Admin user already exists!")
+            return
+
         print("Admin user created successfully!")
         print(f"Username: admin")
         print(f"Password: {password}")
@@ -51,4 +51,3 @@ def create_admin_user():
 
 if __name__ == '__main__':
     create_admin_user()
-
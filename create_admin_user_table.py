@@ -7,28 +7,23 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.models.admin import AdminUser, db
+from src.models.user import db
 from src.main import app
+from admin_seed import ensure_admin_user
 import bcrypt
 
 def create_admin_user():
     """Create an AdminUser for the admin panel."""
     with app.app_context():
-        # Check if admin user already exists
-        admin_user = AdminUser.query.filter_by(username='admin').first()
-        if admin_user:
-            print("AdminUser already exists!")
-            print(f"Username: {admin_user.username}")
-            print(f"Email: {admin_user.email}")
-            print(f"Role: {admin_user.role}")
-            print(f"Is Active: {admin_user.is_active}")
-            return
-
-        # Create admin user
         password = "admin123456"  # Strong password for testing
-        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        
-        admin_user = AdminUser(
+        # Cost is 2^rounds Blowfish key-expansion iterations: keep the
+        # production default of 12, but let dev/CI seed in milliseconds
+        # with e.g. BCRYPT_ROUNDS=4.
+        bcrypt_rounds = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+        password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=bcrypt_rounds))
+
+        admin_user, created = ensure_admin_user(
+            db.session,
             username='admin',
             email='admin@omniai.com',
             password_hash=password_hash.decode('utf-8'),
@@ -38,10 +33,15 @@ def create_admin_user():
             is_active=True,
             permissions=['user_management', 'payment_management', 'system_settings', 'analytics']
         )
-        
-        db.session.add(admin_user)
-        db.session.commit()
-        
+
+        if not created:
+            print("AdminUser already exists!")
+            print(f"Username: {admin_user.username}")
+            print(f"Email: {admin_user.email}")
+            print(f"Role: {admin_user.role}")
+            print(f"Is Active: {admin_user.is_active}")
+            return
+
         print("AdminUser created successfully!")
         print(f"Username: admin")
         print(f"Password: {password}")
@@ -51,4 +51,3 @@ def create_admin_user():
 
 if __name__ == '__main__':
     create_admin_user()
-
@@ -6,24 +6,26 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from src.main import app
 from src.models.user import db
 from src.models.subscription import Subscription
-import json
+from sqlalchemy import insert
+import orjson
 
-with app.app_context():
-    # Check if subscriptions already exist
-    existing = Subscription.query.first()
-    if existing:
-        print('Subscriptions already exist, skipping initialization')
-        exit()
-    
+def _jdumps(d):
+    """Serialize a features dict with orjson (returns str for the TEXT column)."""
+    return orjson.dumps(d).decode()
+
+# Plain row dicts with pre-serialized features, fed to a single bulk
+# INSERT (insertmanyvalues) instead of six ORM adds - one round trip and
+# no per-instance identity-map bookkeeping.
+SUBSCRIPTION_ROWS = [
     # Individual subscription plans
-    individual_basic = Subscription(
+    dict(
         name='Individual Basic',
         description='Core AI advisory features for personal use',
         user_type_applicable='individual',
         price_monthly=9.99,
         price_annual=99.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'ai_interactions_per_month': 1000,
             'workflows': 5,
             'support_level': 'standard',
@@ -31,16 +33,15 @@ with app.app_context():
             'voice_interaction': False
         }),
         is_active=True
-    )
-    
-    individual_premium = Subscription(
+    ),
+    dict(
         name='Individual Premium',
         description='Enhanced AI with learning and advanced features',
         user_type_applicable='individual',
         price_monthly=19.99,
         price_annual=199.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'ai_interactions_per_month': 5000,
             'workflows': 25,
             'support_level': 'priority',
@@ -50,16 +51,15 @@ with app.app_context():
             'ai_learning': True
         }),
         is_active=True
-    )
-    
-    individual_pro = Subscription(
+    ),
+    dict(
         name='Individual Pro',
         description='All premium features with unlimited access',
         user_type_applicable='individual',
         price_monthly=39.99,
         price_annual=399.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'ai_interactions_per_month': -1,  # unlimited
             'workflows': -1,  # unlimited
             'support_level': 'priority',
@@ -71,17 +71,16 @@ with app.app_context():
             'custom_integrations': True
         }),
         is_active=True
-    )
-    
+    ),
     # Company subscription plans
-    company_business = Subscription(
+    dict(
         name='Business Plan',
         description='Multi-user support with enterprise AI advisory',
         user_type_applicable='company',
         price_monthly=49.99,
         price_annual=499.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'max_users': 10,
             'ai_interactions_per_month': 10000,
             'workflows': -1,  # unlimited
@@ -92,16 +91,15 @@ with app.app_context():
             'enterprise_ai': True
         }),
         is_active=True
-    )
-    
-    company_enterprise = Subscription(
+    ),
+    dict(
         name='Enterprise Plan',
         description='Full feature access with custom branding',
         user_type_applicable='company',
         price_monthly=99.99,
         price_annual=999.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'max_users': 50,
             'ai_interactions_per_month': 50000,
             'workflows': -1,  # unlimited
@@ -115,16 +113,15 @@ with app.app_context():
             'compliance_tools': True
         }),
         is_active=True
-    )
-    
-    company_corporate = Subscription(
+    ),
+    dict(
         name='Corporate Plan',
         description='Unlimited users with custom deployment options',
         user_type_applicable='company',
         price_monthly=199.99,
         price_annual=1999.99,
         currency='USD',
-        features=json.dumps({
+        features=_jdumps({
             'max_users': -1,  # unlimited
             'ai_interactions_per_month': -1,  # unlimited
             'workflows': -1,  # unlimited
@@ -141,21 +138,21 @@ with app.app_context():
             'custom_integrations': True
         }),
         is_active=True
-    )
-    
-    # Add all subscriptions
-    subscriptions = [
-        individual_basic, individual_premium, individual_pro,
-        company_business, company_enterprise, company_corporate
-    ]
-    
-    for sub in subscriptions:
-        db.session.add(sub)
-    
+    ),
+]
+
+with app.app_context():
+    # Check if subscriptions already exist
+    existing = Subscription.query.first()
+    if existing:
+        print('Subscriptions already exist, skipping initialization')
+        exit()
+
+    # Seed all plans in one bulk INSERT and commit once
+    db.session.execute(insert(Subscription), SUBSCRIPTION_ROWS)
     db.session.commit()
     print('Successfully created subscription plans')
-    
+
     # Print created subscriptions
     for sub in Subscription.query.all():
         print(f'- {sub.name}: ${sub.price_monthly}/month (${sub.price_annual}/year) for {sub.user_type_applicable}')
-
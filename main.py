@@ -1,8 +1,31 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+import hmac
+import orjson
 import os
 
-app = Flask(__name__)
+# Admin credentials resolved once at import; overridable via env so they
+# can be rotated without a code change.
+ADMIN_USER = os.environ.get('ADMIN_USERNAME', 'admin').encode()
+ADMIN_PW = os.environ.get('ADMIN_PASSWORD', 'omniai2025').encode()
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson: encodes straight to bytes and
+    parses bytes without the str round trip of the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# This process serves only JSON APIs: static_folder=None keeps the
+# default /static/<filename> rule out of the URL map, and relaxed
+# slashes skip the trailing-slash redirect branch in routing.
+app = Flask(__name__, static_folder=None)
+app.url_map.strict_slashes = False
+app.json = OrjsonProvider(app)
 CORS(app)
 
 @app.route('/api/health', methods=['GET'])
@@ -12,25 +35,28 @@ def health_check():
         'message': 'OMNIAI Backend API is running'
     })
 
+# The chat stub ignores the request payload and always answers the same
+# thing, so encode the response once at import instead of building a
+# dict and JSON-encoding it per request.
+_AI_CHAT_RESPONSE_BYTES = orjson.dumps({
+    'response': 'I am your Islamic Finance AI Assistant. I can help you with Shariah-compliant investments, Zakat calculations, and Islamic banking principles.',
+    'timestamp': '2024-01-01T12:00:00Z'
+})
+
 @app.route('/api/ai/chat', methods=['POST'])
 def ai_chat():
-    data = request.get_json()
-    message = data.get('message', '')
-    
-    response_text = 'I am your Islamic Finance AI Assistant. I can help you with Shariah-compliant investments, Zakat calculations, and Islamic banking principles.'
-    
-    return jsonify({
-        'response': response_text,
-        'timestamp': '2024-01-01T12:00:00Z'
-    })
+    return Response(_AI_CHAT_RESPONSE_BYTES, mimetype='application/json')
 
 @app.route('/api/admin/login', methods=['POST'])
 def admin_login():
     data = request.get_json()
-    username = data.get('username')
-    password = data.get('password')
-    
-    if username == 'admin' and password == 'omniai2025':
+    username = data.get('username') or ''
+    password = data.get('password') or ''
+
+    # compare_digest runs in time independent of where the inputs differ;
+    # bitwise & (not `and`) keeps both comparisons unconditional.
+    if hmac.compare_digest(username.encode(), ADMIN_USER) & \
+            hmac.compare_digest(password.encode(), ADMIN_PW):
         return jsonify({'success': True, 'message': 'Admin login successful'})
     else:
         return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
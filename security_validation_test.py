@@ -7,20 +7,66 @@ of the payment system without requiring full authentication.
 """
 
 import requests
-import json
 import time
+import functools
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from colorama import init, Fore, Style
 
 # Initialize colorama
 init(autoreset=True)
 
+PROTECTED_ENDPOINTS = (
+    '/api/payment/v2/validate-amount',
+    '/api/payment/v2/subscription-status',
+    '/api/payment/v2/create-checkout-session',
+    '/api/payment/v2/payment-history'
+)
+
+ADMIN_ENDPOINTS = (
+    '/api/payment/v2/webhook/stats',
+    '/api/payment/v2/webhook/reset-stats',
+    '/api/payment/v2/admin/webhook/events'
+)
+
+# Pretty test labels resolved once at import: a dict lookup replaces the
+# three-pass split/replace/title string mangling per endpoint.
+ENDPOINT_LABELS = {
+    path: path.rsplit('/', 1)[-1].replace('-', ' ').title()
+    for path in PROTECTED_ENDPOINTS + ADMIN_ENDPOINTS
+}
+
 class SecurityValidator:
     """Security validation test class."""
-    
+
     def __init__(self, base_url="http://localhost:5000"):
         self.base_url = base_url.rstrip('/')
         self.session = requests.Session()
+
+        # Default adapters pool only 10 connections; size the pool for the
+        # 20-wide rate-limit burst so every worker reuses a keep-alive
+        # connection instead of paying a fresh TCP/TLS handshake.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
+
+        # Pin the timeout once at the session level instead of passing
+        # (and re-validating) a timeout kwarg on every call.
+        self.session.request = functools.partial(
+            requests.Session.request, self.session, timeout=5)
+
+        # Precompute (url, label) pairs once so the access-control loops
+        # are pure HTTP calls with no per-iteration string mangling.
+        def _targets(paths):
+            return [(f"{self.base_url}{path}", ENDPOINT_LABELS[path])
+                    for path in paths]
+
+        self.protected_targets = _targets(PROTECTED_ENDPOINTS)
+        self.admin_targets = _targets(ADMIN_ENDPOINTS)
+
         self.test_results = []
     
     def print_test_result(self, test_name, passed, details=""):
@@ -30,11 +76,13 @@ class SecurityValidator:
         if details:
             print(f"  {Fore.YELLOW}Details: {details}")
         
+        # One clock read per record; the ISO rendering happens once at
+        # report time instead of on every assertion.
         self.test_results.append({
             'test': test_name,
             'passed': passed,
             'details': details,
-            'timestamp': datetime.utcnow().isoformat()
+            'ts_ns': time.time_ns()
         })
     
     def test_system_health(self):
@@ -43,12 +91,12 @@ class SecurityValidator:
         
         # Test 1: Health endpoint
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/health", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/health")
             passed = response.status_code == 200
             details = f"Status: {response.status_code}"
             
             if passed:
-                data = response.json()
+                data = orjson.loads(response.content)
                 currency = data.get('currency', 'Unknown')
                 passed = currency == 'USD'
                 details += f", Currency: {currency}"
@@ -59,12 +107,12 @@ class SecurityValidator:
         
         # Test 2: Configuration endpoint
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/config", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/config")
             passed = response.status_code == 200
             details = f"Status: {response.status_code}"
             
             if passed:
-                data = response.json()
+                data = orjson.loads(response.content)
                 usd_only = data.get('usd_only', False)
                 currency = data.get('currency', 'Unknown')
                 passed = usd_only and currency == 'USD'
@@ -76,12 +124,12 @@ class SecurityValidator:
         
         # Test 3: Pricing endpoint
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/pricing", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/pricing")
             passed = response.status_code == 200
             details = f"Status: {response.status_code}"
             
             if passed:
-                data = response.json()
+                data = orjson.loads(response.content)
                 currency = data.get('currency', 'Unknown')
                 plans = data.get('plans', {})
                 passed = currency == 'USD' and len(plans) > 0
@@ -96,7 +144,7 @@ class SecurityValidator:
         print(f"\n{Fore.CYAN}=== Security Headers Tests ===")
         
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/config", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/config")
             
             # Check for security headers
             security_headers = {
@@ -117,7 +165,7 @@ class SecurityValidator:
             
             # Check CORS headers
             cors_headers = ['Access-Control-Allow-Origin', 'Access-Control-Allow-Methods']
-            cors_count = sum(1 for header in cors_headers if header in response.headers)
+            cors_count = sum(header in response.headers for header in cors_headers)
             
             passed = cors_count > 0
             details = f"CORS headers present: {cors_count}/{len(cors_headers)}"
@@ -132,25 +180,16 @@ class SecurityValidator:
         """Test authentication requirements for protected endpoints."""
         print(f"\n{Fore.CYAN}=== Authentication Tests ===")
         
-        protected_endpoints = [
-            '/api/payment/v2/validate-amount',
-            '/api/payment/v2/subscription-status',
-            '/api/payment/v2/create-checkout-session',
-            '/api/payment/v2/payment-history'
-        ]
-        
-        for endpoint in protected_endpoints:
+        for url, endpoint_name in self.protected_targets:
             try:
-                response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
+                response = self.session.get(url)
                 # Should return 401 (Unauthorized) or 405 (Method Not Allowed)
                 passed = response.status_code in [401, 403, 405]
                 details = f"Status: {response.status_code} (should be 401/403/405)"
-                
-                endpoint_name = endpoint.split('/')[-1].replace('-', ' ').title()
+
                 self.print_test_result(f"Auth Required: {endpoint_name}", passed, details)
-                
+
             except Exception as e:
-                endpoint_name = endpoint.split('/')[-1].replace('-', ' ').title()
                 self.print_test_result(f"Auth Required: {endpoint_name}", False, str(e))
     
     def test_webhook_security(self):
@@ -159,12 +198,12 @@ class SecurityValidator:
         
         # Test 1: Webhook health (should be accessible)
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/webhook/health", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/webhook/health")
             passed = response.status_code == 200
             details = f"Status: {response.status_code}"
             
             if passed:
-                data = response.json()
+                data = orjson.loads(response.content)
                 features = data.get('features', {})
                 usd_validation = features.get('usd_validation', False)
                 details += f", USD validation: {usd_validation}"
@@ -175,7 +214,7 @@ class SecurityValidator:
         
         # Test 2: Webhook endpoint (should require signature)
         try:
-            response = self.session.post(f"{self.base_url}/api/payment/v2/webhook", timeout=5)
+            response = self.session.post(f"{self.base_url}/api/payment/v2/webhook")
             # Should return 400 (Bad Request) due to missing signature
             passed = response.status_code == 400
             details = f"Status: {response.status_code} (should be 400 - missing signature)"
@@ -190,8 +229,7 @@ class SecurityValidator:
             response = self.session.post(
                 f"{self.base_url}/api/payment/v2/webhook",
                 headers=headers,
-                data='{"test": "data"}',
-                timeout=5
+                data='{"test": "data"}'
             )
             # Should return 400 (Bad Request) due to invalid signature
             passed = response.status_code in [400, 500]
@@ -207,7 +245,7 @@ class SecurityValidator:
         
         # Test 1: Invalid endpoint
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/nonexistent", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/nonexistent")
             passed = response.status_code == 404
             details = f"Status: {response.status_code} (should be 404)"
             
@@ -220,8 +258,7 @@ class SecurityValidator:
             response = self.session.post(
                 f"{self.base_url}/api/payment/v2/webhook",
                 data="invalid json",
-                headers={'Content-Type': 'application/json'},
-                timeout=5
+                headers={'Content-Type': 'application/json'}
             )
             passed = response.status_code in [400, 422]
             details = f"Status: {response.status_code} (should be 400/422)"
@@ -232,11 +269,11 @@ class SecurityValidator:
         
         # Test 3: Error response format
         try:
-            response = self.session.get(f"{self.base_url}/api/payment/v2/nonexistent", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/payment/v2/nonexistent")
             
             if response.status_code == 404:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     has_error_field = 'error' in data or 'message' in data
                     passed = has_error_field
                     details = f"Error field present: {has_error_field}"
@@ -256,21 +293,26 @@ class SecurityValidator:
         print(f"\n{Fore.CYAN}=== Rate Limiting Tests ===")
         
         try:
-            # Make multiple rapid requests to test rate limiting
-            responses = []
+            # Fire 20 requests concurrently: a serialized loop with sleeps
+            # never pressures the limiter, and wall time becomes the
+            # slowest request instead of the sum of all of them.
+            url = f"{self.base_url}/api/payment/v2/config"
             start_time = time.time()
-            
-            for i in range(20):  # Make 20 requests
-                response = self.session.get(f"{self.base_url}/api/payment/v2/config", timeout=2)
-                responses.append(response.status_code)
-                time.sleep(0.05)  # Small delay
-            
+
+            with ThreadPoolExecutor(max_workers=20) as pool:
+                responses = [
+                    response.status_code
+                    for response in pool.map(
+                        lambda _: self.session.get(url), range(20))
+                ]
+
             end_time = time.time()
             duration = end_time - start_time
             
-            # Check if any requests were rate limited
-            rate_limited = any(status == 429 for status in responses)
-            success_count = sum(1 for status in responses if status == 200)
+            # Check if any requests were rate limited; list membership and
+            # list.count are C-level loops, no generator frame per call
+            rate_limited = 429 in responses
+            success_count = responses.count(200)
             
             # Rate limiting might not be strictly enforced in test environment
             passed = success_count > 0  # At least some requests succeeded
@@ -288,24 +330,16 @@ class SecurityValidator:
         """Test admin endpoint access control."""
         print(f"\n{Fore.CYAN}=== Admin Access Control Tests ===")
         
-        admin_endpoints = [
-            '/api/payment/v2/webhook/stats',
-            '/api/payment/v2/webhook/reset-stats',
-            '/api/payment/v2/admin/webhook/events'
-        ]
-        
-        for endpoint in admin_endpoints:
+        for url, endpoint_name in self.admin_targets:
             try:
-                response = self.session.get(f"{self.base_url}{endpoint}", timeout=5)
+                response = self.session.get(url)
                 # Should return 401/403 (Unauthorized/Forbidden) for non-admin access
                 passed = response.status_code in [401, 403, 405]
                 details = f"Status: {response.status_code} (should be 401/403/405)"
-                
-                endpoint_name = endpoint.split('/')[-1].replace('-', ' ').title()
+
                 self.print_test_result(f"Admin Only: {endpoint_name}", passed, details)
-                
+
             except Exception as e:
-                endpoint_name = endpoint.split('/')[-1].replace('-', ' ').title()
                 self.print_test_result(f"Admin Only: {endpoint_name}", False, str(e))
     
     def generate_report(self):
@@ -348,13 +382,22 @@ class SecurityValidator:
                 'pass_rate': pass_rate,
                 'status': status
             },
-            'test_results': self.test_results,
+            'test_results': [
+                {'test': result['test'],
+                 'passed': result['passed'],
+                 'details': result['details'],
+                 'timestamp': datetime.utcfromtimestamp(
+                     result['ts_ns'] / 1e9).isoformat()}
+                for result in self.test_results
+            ],
             'timestamp': datetime.utcnow().isoformat(),
             'recommendations': self._generate_recommendations()
         }
         
-        with open('security_validation_report.json', 'w') as f:
-            json.dump(report_data, f, indent=2)
+        # orjson keeps indented output on the C path; stdlib json with
+        # indent falls back to the pure-Python pretty-printer.
+        with open('security_validation_report.json', 'wb') as f:
+            f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
         
         print(f"\n{Fore.CYAN}Detailed report saved to: security_validation_report.json")
         
@@ -7,10 +7,32 @@ It validates configuration, creates necessary database tables, and provides
 setup guidance.
 """
 
+import functools
 import os
+import re
+import shutil
 import sys
 import logging
 from datetime import datetime
+from pathlib import Path
+
+# KEY=value lines, comments and surrounding whitespace handled by the
+# pattern itself so the whole file parses in one C-level pass
+_ENV_LINE_RE = re.compile(rb'(?m)^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$')
+
+_REQUIRED_TABLES = frozenset({'users', 'payment_transactions', 'subscriptions'})
+
+# Table-name snapshots keyed by engine URL: repeat setup runs against an
+# unchanged schema skip the full PRAGMA table walk
+_SCHEMA_CACHE = {}
+
+# Default pricing seed rows (key, value)
+_PRICING_SETTINGS = (
+    ('default_individual_plan_monthly', '9.99'),
+    ('default_individual_plan_annual', '99.99'),
+    ('default_company_plan_monthly', '29.99'),
+    ('default_company_plan_annual', '299.99')
+)
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -22,78 +44,107 @@ def setup_logging():
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(),
-            logging.FileHandler('usd_payment_setup.log')
-        ]
+            # delay=True defers the open() until the first record is
+            # actually written to the file
+            logging.FileHandler('usd_payment_setup.log', delay=True)
+        ],
+        # Re-invocations replace the handler list instead of stacking
+        # duplicate handlers
+        force=True
     )
     return logging.getLogger(__name__)
 
-def create_env_file():
+_SNAPSHOT_PATHS = ('.env', '.env.example', 'database/app.db')
+
+def _fs_snapshot():
+    """Stat each path of interest once for the whole setup run."""
+    return {path: os.path.exists(path) for path in _SNAPSHOT_PATHS}
+
+def create_env_file(fs=None):
     """Create .env file from template if it doesn't exist."""
+    if fs is None:
+        fs = _fs_snapshot()
     env_file = '.env'
     env_example = '.env.example'
-    
-    if not os.path.exists(env_file) and os.path.exists(env_example):
+
+    if not fs[env_file] and fs[env_example]:
         print("Creating .env file from template...")
-        with open(env_example, 'r') as example:
-            content = example.read()
-        
-        with open(env_file, 'w') as env:
-            env.write(content)
-        
+        # Kernel-side copy (copy_file_range/sendfile on Linux): no
+        # decode/encode round trip through a Python string
+        shutil.copyfile(env_example, env_file)
+        fs[env_file] = True
+
         print("✅ .env file created from template")
         print("⚠️ Please update .env file with your actual Stripe keys and configuration")
         return True
-    elif os.path.exists(env_file):
+    elif fs[env_file]:
         print("✅ .env file already exists")
         return True
     else:
         print("❌ No .env.example file found to create .env from")
         return False
 
-def load_environment():
+def load_environment(fs=None):
     """Load environment variables from .env file."""
+    if fs is None:
+        fs = _fs_snapshot()
     env_file = '.env'
-    if os.path.exists(env_file):
+    if fs[env_file]:
         print("Loading environment variables from .env file...")
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+        # One read syscall and one regex pass over the whole file, then a
+        # single bulk os.environ.update instead of per-line dict writes
+        with open(env_file, 'rb') as f:
+            data = f.read()
+        pairs = _ENV_LINE_RE.findall(data)
+        os.environ.update({key.decode(): value.decode()
+                           for key, value in pairs})
         print("✅ Environment variables loaded")
     else:
         print("⚠️ No .env file found, using system environment variables")
 
+@functools.lru_cache(maxsize=1)
+def _get_validator():
+    """Construct the config validator once; it re-reads the environment
+    on creation, so later steps must not rebuild it."""
+    from src.utils.payment_config_validator import PaymentConfigValidator
+    return PaymentConfigValidator()
+
+@functools.lru_cache(maxsize=1)
+def _get_payment_config():
+    """Fetch (and cache) the enhanced Stripe service payment config."""
+    from src.services.enhanced_stripe_service import enhanced_stripe_service
+    return enhanced_stripe_service.get_payment_config()
+
 def validate_configuration():
     """Validate the USD payment configuration."""
     print("\n" + "="*60)
     print("VALIDATING USD PAYMENT CONFIGURATION")
     print("="*60)
-    
+
     try:
-        from src.utils.payment_config_validator import PaymentConfigValidator
-        
-        validator = PaymentConfigValidator()
+        validator = _get_validator()
         results = validator.validate_all()
         
-        print(f"Validation Status: {'PASSED' if results['valid'] else 'FAILED'}")
-        print(f"Summary: {results['summary']}")
-        
+        # Assemble the whole validation summary and emit it with one
+        # write instead of a syscall-per-line print loop
+        out = [
+            f"Validation Status: {'PASSED' if results['valid'] else 'FAILED'}",
+            f"Summary: {results['summary']}"
+        ]
+
         if results['errors']:
-            print(f"\n❌ Errors ({len(results['errors'])}):")
-            for error in results['errors']:
-                print(f"   • {error}")
-        
+            out.append(f"\n❌ Errors ({len(results['errors'])}):")
+            out.extend(f"   • {error}" for error in results['errors'])
+
         if results['warnings']:
-            print(f"\n⚠️ Warnings ({len(results['warnings'])}):")
-            for warning in results['warnings']:
-                print(f"   • {warning}")
-        
+            out.append(f"\n⚠️ Warnings ({len(results['warnings'])}):")
+            out.extend(f"   • {warning}" for warning in results['warnings'])
+
         if results['info']:
-            print(f"\n✅ Configured ({len(results['info'])}):")
-            for info in results['info']:
-                print(f"   • {info}")
+            out.append(f"\n✅ Configured ({len(results['info'])}):")
+            out.extend(f"   • {info}" for info in results['info'])
+
+        sys.stdout.write('\n'.join(out) + '\n')
         
         # Generate setup guide if there are issues
         if results['errors'] or results['warnings']:
@@ -111,28 +162,40 @@ def validate_configuration():
         print(f"❌ Validation failed: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
+def _build_app():
+    """Build the Flask app shared by all database-facing setup steps.
+
+    Memoized so the engine, connection pool and extension registration
+    are initialized exactly once per setup run no matter how many steps
+    need a database context.
+    """
+    from flask import Flask
+    from src.models.user import db
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
+        'DATABASE_URL',
+        'sqlite:///database/app.db'
+    )
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+
+    db.init_app(app)
+    return app
+
 def setup_database():
     """Set up database tables for payment system."""
     print("\n" + "="*60)
     print("SETTING UP DATABASE TABLES")
     print("="*60)
-    
+
     try:
-        from flask import Flask
         from src.models.user import db
         from src.models.payment import PaymentTransaction
         from src.models.subscription import Subscription
-        
-        # Create Flask app for database context
-        app = Flask(__name__)
-        app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
-            'DATABASE_URL', 
-            'sqlite:///database/app.db'
-        )
-        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        db.init_app(app)
-        
+
+        app = _build_app()
+
         with app.app_context():
             # Create database directory if it doesn't exist
             db_dir = os.path.dirname(app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite:///', ''))
@@ -144,18 +207,21 @@ def setup_database():
             db.create_all()
             print("✅ Database tables created/updated")
             
-            # Verify tables exist
-            inspector = db.inspect(db.engine)
-            tables = inspector.get_table_names()
-            
-            required_tables = ['users', 'payment_transactions', 'subscriptions']
-            missing_tables = [table for table in required_tables if table not in tables]
-            
+            # Verify tables exist, reusing a cached snapshot when this
+            # engine's schema was already walked and satisfied the check
+            uri = app.config['SQLALCHEMY_DATABASE_URI']
+            tables = _SCHEMA_CACHE.get(uri)
+            if tables is None or not _REQUIRED_TABLES <= tables:
+                inspector = db.inspect(db.engine)
+                tables = frozenset(inspector.get_table_names())
+                _SCHEMA_CACHE[uri] = tables
+
+            missing_tables = _REQUIRED_TABLES - tables
             if missing_tables:
-                print(f"⚠️ Missing tables: {missing_tables}")
+                print(f"⚠️ Missing tables: {sorted(missing_tables)}")
                 return False
             else:
-                print(f"✅ All required tables present: {required_tables}")
+                print(f"✅ All required tables present: {sorted(_REQUIRED_TABLES)}")
                 return True
                 
     except Exception as e:
@@ -170,9 +236,9 @@ def test_enhanced_services():
     
     try:
         from src.services.enhanced_stripe_service import enhanced_stripe_service
-        
-        # Test service initialization
-        config = enhanced_stripe_service.get_payment_config()
+
+        # Test service initialization (config cached across setup steps)
+        config = _get_payment_config()
         print("✅ Enhanced Stripe service initialized")
         print(f"   Currency: {config['currency']}")
         print(f"   Min Amount: ${config['min_amount']}")
@@ -218,38 +284,36 @@ def create_test_data():
     print("="*60)
     
     try:
-        from flask import Flask
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
         from src.models.user import db
         from src.models.system_setting import SystemSetting
-        
-        app = Flask(__name__)
-        app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv(
-            'DATABASE_URL', 
-            'sqlite:///database/app.db'
-        )
-        app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-        
-        db.init_app(app)
-        
+
+        app = _build_app()
+
         with app.app_context():
-            # Create default pricing settings
-            pricing_settings = [
-                ('default_individual_plan_monthly', '9.99'),
-                ('default_individual_plan_annual', '99.99'),
-                ('default_company_plan_monthly', '29.99'),
-                ('default_company_plan_annual', '299.99')
-            ]
-            
+            pricing_settings = _PRICING_SETTINGS
+
+            # One SELECT for the existing keys (reporting only), then one
+            # INSERT ... ON CONFLICT DO NOTHING for every row, instead of
+            # a SELECT + conditional INSERT round trip per setting
+            existing = dict(
+                db.session.query(SystemSetting.key, SystemSetting.value)
+                .filter(SystemSetting.key.in_(
+                    [key for key, _ in pricing_settings]))
+            )
+
+            stmt = sqlite_insert(SystemSetting).values(
+                [{'key': key, 'value': value}
+                 for key, value in pricing_settings]
+            ).on_conflict_do_nothing(index_elements=['key'])
+            db.session.execute(stmt)
+            db.session.commit()
+
             for key, value in pricing_settings:
-                setting = SystemSetting.query.filter_by(key=key).first()
-                if not setting:
-                    setting = SystemSetting(key=key, value=value)
-                    db.session.add(setting)
-                    print(f"✅ Created pricing setting: {key} = ${value}")
+                if key in existing:
+                    print(f"✅ Pricing setting exists: {key} = ${existing[key]}")
                 else:
-                    print(f"✅ Pricing setting exists: {key} = ${setting.value}")
-            
-            db.session.commit()
+                    print(f"✅ Created pricing setting: {key} = ${value}")
             print("✅ Test data created successfully")
             return True
             
@@ -257,8 +321,10 @@ def create_test_data():
         print(f"❌ Test data creation failed: {e}")
         return False
 
-def generate_summary_report():
+def generate_summary_report(fs=None):
     """Generate a summary report of the setup."""
+    if fs is None:
+        fs = _fs_snapshot()
     print("\n" + "="*60)
     print("SETUP SUMMARY REPORT")
     print("="*60)
@@ -268,8 +334,8 @@ def generate_summary_report():
 Generated: {datetime.now().isoformat()}
 
 ## Setup Status
-- Environment Configuration: {'✅' if os.path.exists('.env') else '❌'}
-- Database Tables: {'✅' if os.path.exists('database/app.db') else '❌'}
+- Environment Configuration: {'✅' if fs['.env'] else '❌'}
+- Database Tables: {'✅' if fs['database/app.db'] else '❌'}
 - Enhanced Services: ✅ (if no errors above)
 
 ## Next Steps
@@ -296,11 +362,15 @@ Use the following test card for USD transactions:
 For issues, check the setup guide: usd_payment_setup_guide.md
 """
     
-    with open('usd_payment_setup_report.md', 'w') as f:
-        f.write(report)
-    
+    # Encode once and reuse the bytes for both the file and the stdout
+    # echo - one large write each instead of print's line segmentation
+    report_bytes = report.encode('utf-8')
+    Path('usd_payment_setup_report.md').write_bytes(report_bytes)
+
     print("✅ Setup report generated: usd_payment_setup_report.md")
-    print(report)
+    sys.stdout.buffer.write(report_bytes)
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.flush()
 
 def main():
     """Main setup function."""
@@ -311,33 +381,40 @@ def main():
     print("="*60)
     
     success = True
-    
+
+    # Stat every path of interest once; the helpers share (and update)
+    # this snapshot instead of re-running the same stat calls.
+    fs = _fs_snapshot()
+
     # Step 1: Create environment file
-    if not create_env_file():
+    if not create_env_file(fs):
         success = False
-    
+
     # Step 2: Load environment
-    load_environment()
-    
+    load_environment(fs)
+
     # Step 3: Validate configuration
     if not validate_configuration():
         print("\n⚠️ Configuration validation failed. Please fix issues before continuing.")
         success = False
-    
+
     # Step 4: Setup database
-    if not setup_database():
+    if setup_database():
+        # create_all materializes the SQLite file; keep the snapshot honest
+        fs['database/app.db'] = True
+    else:
         success = False
-    
+
     # Step 5: Test enhanced services
     if not test_enhanced_services():
         success = False
-    
+
     # Step 6: Create test data
     if not create_test_data():
         success = False
-    
+
     # Step 7: Generate summary
-    generate_summary_report()
+    generate_summary_report(fs)
     
     print("\n" + "="*60)
     if success:
@@ -5,71 +5,200 @@ Tests all three critical items: Authentication, Error Handling, and Monitoring
 """
 
 import requests
-import json
+from urllib3.util.retry import Retry
+import functools
 import time
+import orjson
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from colorama import init, Fore, Back, Style
 
-# Initialize colorama for colored output
-init(autoreset=True)
+# Color only when attached to a terminal. Under CI redirection the
+# colorama stdout wrapper and the ANSI prefixes are pure overhead, so
+# swap in empty-string stand-ins and leave stdout unwrapped.
+USE_COLOR = sys.stdout.isatty()
+if USE_COLOR:
+    init(autoreset=True)
+else:
+    class _NoColor:
+        def __getattr__(self, _name):
+            return ''
+
+    Fore = Back = Style = _NoColor()
+
+# Format fragments built once at import; the print helpers just
+# interpolate them instead of re-assembling Fore/Style runs per call
+_BAR = f"{Fore.CYAN}{'=' * 60}"
+_PASS = f"{Fore.GREEN}✅ PASS"
+_FAIL = f"{Fore.RED}❌ FAIL"
 
 class OmniAITester:
     def __init__(self, base_url="http://localhost:5000"):
         self.base_url = base_url
         self.admin_token = None
+
+        # One keep-alive session for the whole suite: ~25 sequential
+        # probes against the same host reuse a single TCP connection
+        # instead of paying a fresh handshake per request. Transient 5xx
+        # from a restarting worker get a short backoff-retry instead of
+        # failing the test outright.
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.2,
+                      status_forcelist=(500, 502, 503, 504),
+                      allowed_methods=('GET', 'POST'))
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                                                max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Connection': 'keep-alive'})
+        # Default connect/read timeout for every request on the session;
+        # without it a single hung endpoint can stall the suite for the
+        # platform TCP timeout. Call sites may still pass their own.
+        self.session.request = functools.partial(
+            requests.Session.request, self.session, timeout=(2, 10))
+
+        # The rate-limit burst must observe raw statuses without the
+        # retry policy smoothing them over, so it gets its own session
+        self.burst_session = requests.Session()
+        self.burst_session.mount(
+            'http://', requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=15))
+        self.burst_session.headers.update({'Connection': 'keep-alive'})
+        self.burst_session.request = functools.partial(
+            requests.Session.request, self.burst_session, timeout=(2, 10))
+
+        # Populated once after admin login; avoids rebuilding the
+        # Authorization dict at every call site
+        self.auth_headers = {}
+
+        # Responses from idempotent GETs, keyed by path, so repeated
+        # probes of the same endpoint reuse one round trip
+        self._get_cache = {}
+
+        # Client-side pacing: space ordinary probes ~50ms apart so the
+        # suite never trips the server's limiter by accident and taints
+        # later tests with spurious 429s. The rate-limit burst bypasses
+        # this deliberately.
+        self._throttle_lock = threading.Lock()
+        self._next_allowed = 0.0
+        self._min_interval = 0.05
+
+        # Last observed status per probed path, filled in by _run_probe;
+        # the integration check reads these instead of re-fetching
+        # endpoints the run has already hit
+        self._last_status = {}
+
+        # Categories may record from worker threads
+        self._results_lock = threading.Lock()
         self.test_results = {
-            'authentication': {'passed': 0, 'failed': 0, 'tests': []},
-            'error_handling': {'passed': 0, 'failed': 0, 'tests': []},
-            'monitoring': {'passed': 0, 'failed': 0, 'tests': []},
+            'authentication': {'passed': 0, 'failed': 0},
+            'error_handling': {'passed': 0, 'failed': 0},
+            'monitoring': {'passed': 0, 'failed': 0},
             'overall': {'passed': 0, 'failed': 0}
         }
+        # Flat append-only record list: one small tuple per test instead
+        # of a five-key dict, expanded into the report shape exactly
+        # once when the report is written
+        self._test_records = []
     
     def print_header(self, title):
         """Print a formatted header"""
-        print(f"\n{Fore.CYAN}{'='*60}")
-        print(f"{Fore.CYAN}{title.center(60)}")
-        print(f"{Fore.CYAN}{'='*60}")
-    
+        print(f"\n{_BAR}\n{Fore.CYAN}{title.center(60)}\n{_BAR}")
+
     def print_test_result(self, test_name, passed, message="", details=None):
         """Print test result with color coding"""
-        status = f"{Fore.GREEN}✅ PASS" if passed else f"{Fore.RED}❌ FAIL"
-        print(f"{status} {test_name}")
+        status = _PASS if passed else _FAIL
+        line = f"{status} {test_name}"
         if message:
-            print(f"      {Fore.YELLOW}{message}")
+            line += f"\n      {Fore.YELLOW}{message}"
         if details and not passed:
-            print(f"      {Fore.RED}Details: {details}")
+            line += f"\n      {Fore.RED}Details: {details}"
+        # One write (and one stdout lock) per result instead of up to three
+        print(line)
         return passed
     
     def record_test_result(self, category, test_name, passed, message="", details=None):
         """Record test result for reporting"""
-        result = {
-            'name': test_name,
-            'passed': passed,
-            'message': message,
-            'details': details,
-            'timestamp': datetime.utcnow().isoformat()
-        }
-        
-        self.test_results[category]['tests'].append(result)
-        if passed:
-            self.test_results[category]['passed'] += 1
-            self.test_results['overall']['passed'] += 1
-        else:
-            self.test_results[category]['failed'] += 1
-            self.test_results['overall']['failed'] += 1
+        # Timestamp kept as a nanosecond int; rendered to ISO form once
+        # when the report is written
+        record = (category, test_name, passed, message, details, time.time_ns())
+
+        with self._results_lock:
+            self._test_records.append(record)
+            if passed:
+                self.test_results[category]['passed'] += 1
+                self.test_results['overall']['passed'] += 1
+            else:
+                self.test_results[category]['failed'] += 1
+                self.test_results['overall']['failed'] += 1
     
+    def _throttle(self):
+        """Reserve a send slot in the client-side token bucket."""
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self._min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def _cached_get(self, path, **kwargs):
+        """GET an idempotent endpoint once per run and reuse the response.
+
+        The rate-limit burst bypasses this on purpose - it needs fresh
+        requests to pressure the limiter.
+        """
+        response = self._get_cache.get(path)
+        if response is None:
+            response = self._throttled_get(f"{self.base_url}{path}", **kwargs)
+            self._get_cache[path] = response
+        return response
+
+    def _throttled_get(self, url, **kwargs):
+        """GET through the token bucket."""
+        self._throttle()
+        return self.session.get(url, **kwargs)
+
+    def _status_only(self, url, **kwargs):
+        """GET with stream=True and close without touching the body.
+
+        For probes that only assert on the status code this skips the
+        body download and JSON decode entirely. Goes through the
+        no-retry burst session so limiter 429s stay visible.
+        """
+        with self.burst_session.get(url, stream=True, **kwargs) as response:
+            return response.status_code
+
+    def _gather(self, paths):
+        """Fetch several same-host admin endpoints concurrently.
+
+        Returns {path: future}; each test block calls .result() inside
+        its own try/except so per-probe failures stay isolated. requests
+        cannot multiplex HTTP/2 streams, so overlapping the requests on
+        the keep-alive pool is how the serial RTT stacking is removed.
+        """
+        executor = ThreadPoolExecutor(max_workers=len(paths))
+        try:
+            return {
+                path: executor.submit(self._throttled_get,
+                                      f"{self.base_url}{path}",
+                                      headers=self.auth_headers)
+                for path in paths
+            }
+        finally:
+            executor.shutdown(wait=False)
+
     def test_authentication_improvements(self):
         """Test Item 1: Authentication Gaps Fixed"""
         self.print_header("TESTING ITEM 1: AUTHENTICATION IMPROVEMENTS")
         
         # Test 1: Enhanced Authentication Endpoints
         try:
-            response = requests.get(f"{self.base_url}/api/auth/v2/pricing")
+            response = self._cached_get('/api/auth/v2/pricing')
             passed = response.status_code == 200
             message = f"Status: {response.status_code}"
             if passed:
-                data = response.json()
+                data = orjson.loads(response.content)
                 message += f", Plans: {len(data.get('data', {}).get('plans', []))}"
             
             self.print_test_result("Enhanced Auth Pricing Endpoint", passed, message)
@@ -86,15 +215,17 @@ class OmniAITester:
                 "password": "omniai2025",
                 "user_type": "admin"
             }
-            response = requests.post(f"{self.base_url}/api/auth/v2/admin/login", 
+            self._throttle()
+            response = self.session.post(f"{self.base_url}/api/auth/v2/admin/login",
                                    json=admin_data)
             passed = response.status_code in [200, 401]  # 401 is acceptable if credentials are wrong
             message = f"Status: {response.status_code}"
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get('success') and 'token' in data.get('data', {}):
                     self.admin_token = data['data']['token']
+                    self.auth_headers = {'Authorization': f'Bearer {self.admin_token}'}
                     message += ", Token received"
             
             self.print_test_result("Enhanced Admin Login", passed, message)
@@ -105,17 +236,24 @@ class OmniAITester:
         
         # Test 3: Rate Limiting Protection
         try:
-            # Make multiple rapid requests to test rate limiting
-            responses = []
-            for i in range(15):  # Exceed typical rate limit
-                response = requests.get(f"{self.base_url}/api/auth/v2/pricing")
-                responses.append(response.status_code)
-            
+            # Fire the burst concurrently: 15 serial round trips collapse
+            # to roughly one RTT and actually pressure the limiter
+            url = f"{self.base_url}/api/auth/v2/pricing"
+            with ThreadPoolExecutor(max_workers=15) as executor:
+                futures = [executor.submit(self._status_only, url)
+                           for _ in range(15)]  # Exceed typical rate limit
+                responses = [future.result() for future in futures]
+
             # Check if rate limiting kicked in
             rate_limited = 429 in responses
             passed = rate_limited or all(r == 200 for r in responses)
             message = f"Rate limiting {'detected' if rate_limited else 'not triggered'}"
-            
+
+            # Let the server's rate window roll over so the deliberate
+            # overrun does not bleed 429s into the remaining tests
+            if rate_limited:
+                time.sleep(1.0)
+
             self.print_test_result("Rate Limiting Protection", passed, message)
             self.record_test_result('authentication', 'rate_limiting', passed, message)
         except Exception as e:
@@ -124,7 +262,7 @@ class OmniAITester:
         
         # Test 4: Security Headers
         try:
-            response = requests.get(f"{self.base_url}/api/auth/v2/pricing")
+            response = self._cached_get('/api/auth/v2/pricing')
             headers = response.headers
             
             security_headers = [
@@ -144,37 +282,89 @@ class OmniAITester:
             self.print_test_result("Security Headers", False, f"Error: {str(e)}")
             self.record_test_result('authentication', 'security_headers', False, str(e))
     
-    def test_error_handling_improvements(self):
-        """Test Item 2: Error Handling Improvements"""
-        self.print_header("TESTING ITEM 2: ERROR HANDLING IMPROVEMENTS")
-        
-        # Test 1: Error Monitoring Endpoint
+    # Uniform admin GET probes as (name, title, path, validator) rows.
+    # Each validator maps a decoded 200 payload to a message suffix;
+    # _run_probe supplies the shared status check, error handling and
+    # result recording, so adding a probe is one table row instead of a
+    # ten-line try/except block.
+    ERROR_PROBES = (
+        ('error_monitoring', 'Error Monitoring Endpoint',
+         '/api/admin/errors/stats',
+         lambda data: ', Error stats retrieved' if data.get('success') else ''),
+        ('error_health', 'Error Health Monitoring',
+         '/api/admin/errors/health',
+         lambda data: (f", Health score: {data['data']['health_score']}"
+                       if data.get('success') and
+                       'health_score' in data.get('data', {}) else '')),
+        ('error_resolution', 'Error Resolution Tracking',
+         '/api/admin/errors/recent',
+         lambda data: (f", Recent errors: {len(data.get('data', {}).get('errors', []))}"
+                       if data.get('success') else '')),
+    )
+
+    MONITORING_PROBES = (
+        ('monitoring_status', 'Monitoring Service Status',
+         '/api/admin/monitoring/status',
+         lambda data: (f", Monitoring: "
+                       f"{'Active' if data.get('data', {}).get('monitoring_active', False) else 'Inactive'}"
+                       if data.get('success') else '')),
+        ('system_health', 'System Health Monitoring',
+         '/api/admin/monitoring/health',
+         lambda data: (f", Health: {data.get('data', {}).get('health_score', 0)}/100"
+                       f" ({data.get('data', {}).get('status', 'unknown')})"
+                       if data.get('success') else '')),
+        ('metrics_collection', 'Metrics Collection',
+         '/api/admin/monitoring/metrics',
+         lambda data: (f", Metrics collected: {len(data.get('data', {}).get('latest_metrics', {}))}"
+                       if data.get('success') else '')),
+        ('alert_management', 'Alert Management',
+         '/api/admin/monitoring/alerts',
+         lambda data: (f", Alerts: {len(data.get('data', {}).get('alerts', []))}"
+                       if data.get('success') else '')),
+        ('monitoring_dashboard', 'Monitoring Dashboard',
+         '/api/admin/monitoring/dashboard',
+         lambda data: (", Dashboard components: %d/3" % sum(
+             key in data.get('data', {})
+             for key in ('health_summary', 'recent_alerts', 'key_metrics'))
+                       if data.get('success') else '')),
+    )
+
+    def _run_probe(self, category, name, title, path, future, validator):
+        """Resolve one gathered probe: status check, payload validation,
+        print and record."""
         try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/errors/stats", headers=headers)
+            response = future.result()
+            self._last_status[path] = response.status_code
             passed = response.status_code in [200, 401]  # 401 acceptable if not authenticated
             message = f"Status: {response.status_code}"
-            
             if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    message += ", Error stats retrieved"
-            
-            self.print_test_result("Error Monitoring Endpoint", passed, message)
-            self.record_test_result('error_handling', 'error_monitoring', passed, message)
+                message += validator(orjson.loads(response.content))
+            self.print_test_result(title, passed, message)
+            self.record_test_result(category, name, passed, message)
         except Exception as e:
-            self.print_test_result("Error Monitoring Endpoint", False, f"Error: {str(e)}")
-            self.record_test_result('error_handling', 'error_monitoring', False, str(e))
-        
+            self.print_test_result(title, False, f"Error: {str(e)}")
+            self.record_test_result(category, name, False, str(e))
+
+    def test_error_handling_improvements(self):
+        """Test Item 2: Error Handling Improvements"""
+        self.print_header("TESTING ITEM 2: ERROR HANDLING IMPROVEMENTS")
+
+        # Overlap the admin probes; _run_probe consumes each future
+        probes = self._gather([path for _, _, path, _ in self.ERROR_PROBES])
+
+        # Test 1: Error Monitoring Endpoint
+        name, title, path, validator = self.ERROR_PROBES[0]
+        self._run_probe('error_handling', name, title, path, probes[path], validator)
+
         # Test 2: Custom Error Responses
         try:
             # Test 404 error handling
-            response = requests.get(f"{self.base_url}/api/nonexistent/endpoint")
+            response = self._throttled_get(f"{self.base_url}/api/nonexistent/endpoint")
             passed = response.status_code == 404
             
             if passed:
                 try:
-                    data = response.json()
+                    data = orjson.loads(response.content)
                     has_error_structure = 'error' in data and 'id' in data.get('error', {})
                     passed = has_error_structure
                     message = "Custom error structure present" if has_error_structure else "Basic 404 response"
@@ -189,150 +379,20 @@ class OmniAITester:
             self.print_test_result("Custom Error Responses", False, f"Error: {str(e)}")
             self.record_test_result('error_handling', 'custom_errors', False, str(e))
         
-        # Test 3: Error Health Endpoint
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/errors/health", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success') and 'health_score' in data.get('data', {}):
-                    health_score = data['data']['health_score']
-                    message += f", Health score: {health_score}"
-            
-            self.print_test_result("Error Health Monitoring", passed, message)
-            self.record_test_result('error_handling', 'error_health', passed, message)
-        except Exception as e:
-            self.print_test_result("Error Health Monitoring", False, f"Error: {str(e)}")
-            self.record_test_result('error_handling', 'error_health', False, str(e))
-        
-        # Test 4: Error Resolution Tracking
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/errors/recent", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    errors = data.get('data', {}).get('errors', [])
-                    message += f", Recent errors: {len(errors)}"
-            
-            self.print_test_result("Error Resolution Tracking", passed, message)
-            self.record_test_result('error_handling', 'error_resolution', passed, message)
-        except Exception as e:
-            self.print_test_result("Error Resolution Tracking", False, f"Error: {str(e)}")
-            self.record_test_result('error_handling', 'error_resolution', False, str(e))
+        # Tests 3-4: remaining uniform error probes
+        for name, title, path, validator in self.ERROR_PROBES[1:]:
+            self._run_probe('error_handling', name, title, path, probes[path], validator)
     
     def test_monitoring_improvements(self):
         """Test Item 3: Enhanced Monitoring and Alerting"""
         self.print_header("TESTING ITEM 3: MONITORING & ALERTING IMPROVEMENTS")
-        
-        # Test 1: Monitoring Service Status
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/monitoring/status", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    monitoring_active = data.get('data', {}).get('monitoring_active', False)
-                    message += f", Monitoring: {'Active' if monitoring_active else 'Inactive'}"
-            
-            self.print_test_result("Monitoring Service Status", passed, message)
-            self.record_test_result('monitoring', 'monitoring_status', passed, message)
-        except Exception as e:
-            self.print_test_result("Monitoring Service Status", False, f"Error: {str(e)}")
-            self.record_test_result('monitoring', 'monitoring_status', False, str(e))
-        
-        # Test 2: System Health Monitoring
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/monitoring/health", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    health_data = data.get('data', {})
-                    health_score = health_data.get('health_score', 0)
-                    status = health_data.get('status', 'unknown')
-                    message += f", Health: {health_score}/100 ({status})"
-            
-            self.print_test_result("System Health Monitoring", passed, message)
-            self.record_test_result('monitoring', 'system_health', passed, message)
-        except Exception as e:
-            self.print_test_result("System Health Monitoring", False, f"Error: {str(e)}")
-            self.record_test_result('monitoring', 'system_health', False, str(e))
-        
-        # Test 3: Metrics Collection
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/monitoring/metrics", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    metrics = data.get('data', {}).get('latest_metrics', {})
-                    message += f", Metrics collected: {len(metrics)}"
-            
-            self.print_test_result("Metrics Collection", passed, message)
-            self.record_test_result('monitoring', 'metrics_collection', passed, message)
-        except Exception as e:
-            self.print_test_result("Metrics Collection", False, f"Error: {str(e)}")
-            self.record_test_result('monitoring', 'metrics_collection', False, str(e))
-        
-        # Test 4: Alert Management
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/monitoring/alerts", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    alerts = data.get('data', {}).get('alerts', [])
-                    message += f", Alerts: {len(alerts)}"
-            
-            self.print_test_result("Alert Management", passed, message)
-            self.record_test_result('monitoring', 'alert_management', passed, message)
-        except Exception as e:
-            self.print_test_result("Alert Management", False, f"Error: {str(e)}")
-            self.record_test_result('monitoring', 'alert_management', False, str(e))
-        
-        # Test 5: Monitoring Dashboard
-        try:
-            headers = {'Authorization': f'Bearer {self.admin_token}'} if self.admin_token else {}
-            response = requests.get(f"{self.base_url}/api/admin/monitoring/dashboard", headers=headers)
-            passed = response.status_code in [200, 401]
-            message = f"Status: {response.status_code}"
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    dashboard_data = data.get('data', {})
-                    has_health = 'health_summary' in dashboard_data
-                    has_alerts = 'recent_alerts' in dashboard_data
-                    has_metrics = 'key_metrics' in dashboard_data
-                    
-                    components = sum([has_health, has_alerts, has_metrics])
-                    message += f", Dashboard components: {components}/3"
-            
-            self.print_test_result("Monitoring Dashboard", passed, message)
-            self.record_test_result('monitoring', 'monitoring_dashboard', passed, message)
-        except Exception as e:
-            self.print_test_result("Monitoring Dashboard", False, f"Error: {str(e)}")
-            self.record_test_result('monitoring', 'monitoring_dashboard', False, str(e))
-    
+
+        # Overlap the admin probes; _run_probe consumes each future
+        probes = self._gather([path for _, _, path, _ in self.MONITORING_PROBES])
+
+        for name, title, path, validator in self.MONITORING_PROBES:
+            self._run_probe('monitoring', name, title, path, probes[path], validator)
+
     def test_integration(self):
         """Test integration between all three improvements"""
         self.print_header("TESTING INTEGRATION OF ALL IMPROVEMENTS")
@@ -345,15 +405,15 @@ class OmniAITester:
                     '/api/admin/monitoring/health',
                     '/api/admin/monitoring/dashboard'
                 ]
-                
-                headers = {'Authorization': f'Bearer {self.admin_token}'}
-                accessible_endpoints = 0
-                
-                for endpoint in endpoints:
-                    response = requests.get(f"{self.base_url}{endpoint}", headers=headers)
-                    if response.status_code == 200:
-                        accessible_endpoints += 1
-                
+
+                # The probe tables already hit all three endpoints with
+                # the admin token this run; reuse their recorded
+                # statuses instead of paying three more round trips
+                accessible_endpoints = sum(
+                    self._last_status.get(endpoint, 0) == 200
+                    for endpoint in endpoints
+                )
+
                 passed = accessible_endpoints >= 2  # At least 2 endpoints accessible
                 message = f"Accessible endpoints: {accessible_endpoints}/{len(endpoints)}"
                 
@@ -373,37 +433,45 @@ class OmniAITester:
         total_tests = self.test_results['overall']['passed'] + self.test_results['overall']['failed']
         success_rate = (self.test_results['overall']['passed'] / total_tests * 100) if total_tests > 0 else 0
         
-        print(f"\n{Fore.CYAN}📊 OVERALL RESULTS:")
-        print(f"   Total Tests: {total_tests}")
-        print(f"   Passed: {Fore.GREEN}{self.test_results['overall']['passed']}")
-        print(f"   Failed: {Fore.RED}{self.test_results['overall']['failed']}")
-        print(f"   Success Rate: {Fore.YELLOW}{success_rate:.1f}%")
-        
+        # Buffer the whole report and flush it with a single write
+        # instead of a dozen individually locked/flushed print calls
+        out = [
+            f"\n{Fore.CYAN}📊 OVERALL RESULTS:",
+            f"   Total Tests: {total_tests}",
+            f"   Passed: {Fore.GREEN}{self.test_results['overall']['passed']}",
+            f"   Failed: {Fore.RED}{self.test_results['overall']['failed']}",
+            f"   Success Rate: {Fore.YELLOW}{success_rate:.1f}%"
+        ]
+
         # Category breakdown
         for category, results in self.test_results.items():
             if category == 'overall':
                 continue
-            
+
             category_total = results['passed'] + results['failed']
             category_rate = (results['passed'] / category_total * 100) if category_total > 0 else 0
-            
-            print(f"\n{Fore.MAGENTA}📋 {category.upper().replace('_', ' ')}:")
-            print(f"   Passed: {Fore.GREEN}{results['passed']}")
-            print(f"   Failed: {Fore.RED}{results['failed']}")
-            print(f"   Success Rate: {Fore.YELLOW}{category_rate:.1f}%")
-        
+
+            out.append(f"\n{Fore.MAGENTA}📋 {category.upper().replace('_', ' ')}:")
+            out.append(f"   Passed: {Fore.GREEN}{results['passed']}")
+            out.append(f"   Failed: {Fore.RED}{results['failed']}")
+            out.append(f"   Success Rate: {Fore.YELLOW}{category_rate:.1f}%")
+
         # Recommendations
-        print(f"\n{Fore.CYAN}💡 RECOMMENDATIONS:")
-        
+        out.append(f"\n{Fore.CYAN}💡 RECOMMENDATIONS:")
+
         if self.test_results['authentication']['failed'] > 0:
-            print(f"   {Fore.YELLOW}• Review authentication configuration and admin credentials")
-        
+            out.append(f"   {Fore.YELLOW}• Review authentication configuration and admin credentials")
+
         if self.test_results['error_handling']['failed'] > 0:
-            print(f"   {Fore.YELLOW}• Verify error handling middleware is properly initialized")
-        
+            out.append(f"   {Fore.YELLOW}• Verify error handling middleware is properly initialized")
+
         if self.test_results['monitoring']['failed'] > 0:
-            print(f"   {Fore.YELLOW}• Check monitoring service dependencies and Redis connectivity")
-        
+            out.append(f"   {Fore.YELLOW}• Check monitoring service dependencies and Redis connectivity")
+
+        # Join with a reset per line to match autoreset's behaviour
+        reset_newline = f"{Style.RESET_ALL}\n"
+        sys.stdout.write(reset_newline.join(out) + reset_newline)
+
         if success_rate >= 80:
             print(f"   {Fore.GREEN}✅ System is ready for production deployment")
         elif success_rate >= 60:
@@ -411,33 +479,66 @@ class OmniAITester:
         else:
             print(f"   {Fore.RED}❌ System requires significant improvements before production")
         
-        # Save detailed report
+        # Save detailed report: expand the flat record tuples into the
+        # per-category dict shape only now, at report time
+        report_data = {
+            category: results if category == 'overall' else {
+                'passed': results['passed'],
+                'failed': results['failed'],
+                'tests': []
+            }
+            for category, results in self.test_results.items()
+        }
+        for category, name, passed, message, details, ts_ns in self._test_records:
+            report_data[category]['tests'].append({
+                'name': name,
+                'passed': passed,
+                'message': message,
+                'details': details,
+                'timestamp': datetime.utcfromtimestamp(ts_ns / 1e9).isoformat()
+            })
+
         report_file = f"omniai_test_report_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2)
-        
+
+        def _write_report():
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+
+        # Write the file off the hot path so the summary is not held up
+        # by disk latency; join before returning so the report is durable
+        # by the time the process exits.
+        writer = threading.Thread(target=_write_report)
+        writer.start()
+
         print(f"\n{Fore.CYAN}📄 Detailed report saved to: {report_file}")
+        writer.join()
     
     def run_all_tests(self):
         """Run all test suites"""
         print(f"{Fore.CYAN}🚀 Starting OMNIAI Critical Improvements Test Suite")
         print(f"{Fore.CYAN}⏰ Test started at: {datetime.utcnow().isoformat()}")
         
-        # Check if server is running
+        # Check if server is running (warms the pricing-response cache)
         try:
-            response = requests.get(f"{self.base_url}/api/auth/v2/pricing", timeout=5)
+            response = self._cached_get('/api/auth/v2/pricing', timeout=5)
             print(f"{Fore.GREEN}✅ Server is running at {self.base_url}")
         except:
             print(f"{Fore.RED}❌ Server is not accessible at {self.base_url}")
             print(f"{Fore.YELLOW}Please ensure the Flask application is running")
             return
         
-        # Run test suites
+        # Authentication runs first (it acquires the admin token); the
+        # error-handling and monitoring categories only issue independent
+        # probes, so they run concurrently before the integration check.
         self.test_authentication_improvements()
-        self.test_error_handling_improvements()
-        self.test_monitoring_improvements()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(self.test_error_handling_improvements),
+                           executor.submit(self.test_monitoring_improvements)]:
+                future.result()
+
         self.test_integration()
-        
+
         # Generate report
         self.generate_report()
 